@@ -1,6 +1,7 @@
 import src.utils.utilities as utils 
 import src.utils.databases as database_utils
 import pandas as pd
+import numpy as np
 import os
 import shutil
 
@@ -20,27 +21,55 @@ def create_connection():
 
 def read_source_data(path):
     """
-    Reads all CSV files from a given directory and concatenates them into a single DataFrame.
+    Reads all CSV and Parquet files from a given directory and concatenates them into a single DataFrame.
 
     Args:
-        path (str): The directory path where the source CSV files are located.
+        path (str): The directory path where the source files are located.
 
     Returns:
-        DataFrame: A pandas DataFrame containing the concatenated data from all CSV files in the specified directory.
+        DataFrame: A pandas DataFrame containing the concatenated data from all files in the specified directory.
 
     Notes:
-        The function adds a 'load_ts' column to each DataFrame extracted from a CSV file to indicate the load timestamp derived from the filename.
+        The function adds a 'load_ts' column to each DataFrame extracted from a file to indicate the load timestamp derived from the filename.
     """
     objects = utils.list_objects_in_directory(path)
     df_list = []
     for filename in objects:
-        df = pd.read_csv(os.path.join(path, filename), index_col=None, header=0)
-        df['load_ts'] = filename.replace('.csv', '')
+        load_ts, extension = os.path.splitext(filename)
+        if extension == '.parquet':
+            df = stringify_nested_columns(pd.read_parquet(os.path.join(path, filename)))
+        else:
+            df = pd.read_csv(os.path.join(path, filename), index_col=None, header=0)
+        df['load_ts'] = load_ts
         df_list.append(df)
     df = pd.concat(df_list, axis=0, ignore_index=True)
     return df
 
 
+def stringify_nested_columns(df):
+    """
+    Converts list and dict values read from Parquet into the text a CSV staged file would hold.
+
+    Args:
+        df (DataFrame): A pandas DataFrame read from a Parquet file.
+
+    Returns:
+        DataFrame: The DataFrame with list, array and dict values replaced by their string form, e.g. "[-37.8, 144.9]".
+
+    Notes:
+        Parquet returns list fields such as geo points as numpy arrays, which to_sql would store as raw BLOBs.
+    """
+    def to_text(value):
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        return str(value) if isinstance(value, (list, dict)) else value
+
+    for column in df.columns[df.dtypes == object]:
+        if df[column].map(lambda value: isinstance(value, (np.ndarray, list, dict))).any():
+            df[column] = df[column].map(to_text)
+    return df
+
+
 def archive_ingested_data(path):
     """
     Moves ingested data files from the sourcing directory to the archival directory.
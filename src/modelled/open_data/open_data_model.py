@@ -1,25 +1,74 @@
 import src.utils.utilities as utils 
 import src.utils.databases as database_utils
+import src.utils.columnar as columnar_utils
+import pandas as pd
 
+SQL_MODEL_TYPE = 'sql'
+COLUMNAR_MODEL_TYPE = 'columnar'
 
 
 def run_transform(NAMESPACE,attributes):
     ouptut_table_name = attributes['table_name']#'top_10_locations'
-    sql = attributes['sql']
+    model_type = attributes.get('model_type', SQL_MODEL_TYPE)
     
     staging_table_name = f'{ouptut_table_name}_stg'
 
-    print('Connecting to ingestion db')
-    source_connection = database_utils.get_db_connection(database_utils.SILVER_LAYER_DB_NAME)
     print('Connecting to modelled db')
     destination_connection = database_utils.get_db_connection(database_utils.GOLD_LAYER_DB_NAME)
-    print('Running query')
-    df = database_utils.get_query_df(sql,source_connection)
+    if model_type == COLUMNAR_MODEL_TYPE:
+        print('Running columnar pipeline over staged files')
+        df = columnar_utils.run_pipeline(NAMESPACE, attributes)
+        if attributes.get('parity_table') and not check_parity(df, attributes['parity_table'], destination_connection):
+            raise ValueError(f"{ouptut_table_name} does not match {attributes['parity_table']}, not writing it")
+    else:
+        print('Connecting to ingestion db')
+        source_connection = database_utils.get_db_connection(database_utils.SILVER_LAYER_DB_NAME)
+        print('Running query')
+        df = database_utils.get_query_df(attributes['sql'],source_connection)
     print(f'writing to staging {staging_table_name} modelled db')
     database_utils.load_data(destination_connection, df,NAMESPACE, staging_table_name, 'replace')
     print(f'writing to {ouptut_table_name} modelled db')
     database_utils.replace_database(destination_connection, df, staging_table_name, ouptut_table_name, primary_key = None)
     print(f"writing csv reference output as {NAMESPACE}_{ouptut_table_name}_ref.csv")
     df.to_csv(f"{NAMESPACE}_{ouptut_table_name}_ref.csv", index= False)
-    
 
+
+def check_parity(df, parity_table, connection):
+    """
+    Compares a columnar model output with the output of the equivalent SQL model.
+
+    Args:
+        df (DataFrame): The output of the columnar model.
+        parity_table (str): The modelled table written by the SQL model to compare against.
+        connection (sqlite3.Connection): The modelled database connection.
+
+    Returns:
+        bool: True if both outputs hold the same rows, False otherwise.
+
+    Raises:
+        ValueError: If the parity table does not exist in the modelled database.
+
+    Notes:
+        Rows are compared irrespective of order and dtypes, since ties in the SQL ordering are not deterministic
+        and SQLite does not keep pandas dtypes.
+    """
+    print(f'Checking parity with {parity_table}')
+    cursor = connection.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?;", (parity_table,))
+    if not cursor.fetchall():
+        raise ValueError(f'Parity table {parity_table} does not exist, run its SQL model before the columnar model')
+    expected = database_utils.get_query_df(f'select * from {parity_table}', connection)
+    if list(expected.columns) != list(df.columns) or len(expected) != len(df):
+        print(f'Parity check failed: expected {len(expected)} rows of {list(expected.columns)}, got {len(df)} rows of {list(df.columns)}')
+        return False
+
+    columns = list(df.columns)
+    expected = expected.sort_values(columns).reset_index(drop=True)
+    actual = df.sort_values(columns).reset_index(drop=True)
+    try:
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+    except AssertionError as e:
+        print(f'Parity check failed: {e}')
+        return False
+
+    print(f'Parity check passed against {parity_table}')
+    return True
@@ -1,3 +1,4 @@
+import json
 import requests
 import pandas as pd
 from datetime import datetime
@@ -22,21 +23,21 @@ def open_api_handler(config, database):
         without date filters; otherwise, it collects data over a specified lookback period using the lookback_collect function.
     """
     url = config['open_api_url']
+    schema = config[NAMESPACE][database].get('schema')
     if config[NAMESPACE][database]['lookback'] == False:
         date = None
-        df = open_api_to_df(url, database, date)
+        df = open_api_to_df(url, database, date, schema=schema)
     else:
         lookback_days = config[NAMESPACE][database]['lookback_days']
         source_date_column = config[NAMESPACE][database]['source_date_column']
-        df = lookback_collect(url, database, lookback_days, source_date_column)
-    
-    field_list = list(df['fields'])
-    df = pd.DataFrame(field_list)
-    staging_path = utils.stage_data(NAMESPACE, database, df, 'csv', config[NAMESPACE][database]['overwrite_sourced'])
+        df = lookback_collect(url, database, lookback_days, source_date_column, schema)
+
+    file_format = config[NAMESPACE][database].get('file_format', 'csv')
+    staging_path = utils.stage_data(NAMESPACE, database, df, file_format, config[NAMESPACE][database]['overwrite_sourced'])
     return staging_path
 
 
-def lookback_collect(url, database, lookback_days, source_date_column):
+def lookback_collect(url, database, lookback_days, source_date_column, schema=None):
     """
     Collects data over a specified lookback period by making API requests for each date.
 
@@ -45,29 +46,30 @@ def lookback_collect(url, database, lookback_days, source_date_column):
         database (str): The name of the dataset to fetch.
         lookback_days (int): Number of days to look back from today.
         source_date_column (str): The column name in the dataset used to filter by date.
+        schema (dict, optional): Mapping of column names to dtypes for the `fields` payload. Inferred when None.
 
     Returns:
-        DataFrame: A pandas DataFrame containing the concatenated data fetched from the API over the lookback period.
+        DataFrame: A pandas DataFrame containing the data fetched from the API over the lookback period.
 
     Notes:
         This function constructs a list of dates for the lookback period and makes API requests for each date to fetch the relevant data.
+        Every page is decoded into the same set of column arrays, so the DataFrame is built once at the end instead of being concatenated per page.
     """
     today = datetime.now()
     subset_date = pd.to_datetime(today) - pd.DateOffset(days=lookback_days)
     dates = pd.date_range(start=subset_date, end=today)
     date_list = [date.strftime('%Y/%m/%d') for date in dates]
     print("Looking for these dates: \n", date_list)
-    df = pd.DataFrame()
+    columns = init_columns(schema)
 
     for date in date_list:
-        batch = open_api_to_df(url, database, date, source_date_column)
-        print(len(batch))
-        df = pd.concat([df, batch], ignore_index=True)
-    
-    return df
+        batch_size = fetch_columns(url, database, date, columns, source_date_column)
+        print(batch_size)
 
+    return columns_to_df(columns, schema)
 
-def open_api_to_df(url, database, date, source_date_column=None):
+
+def open_api_to_df(url, database, date, source_date_column=None, schema=None):
     """
     Fetches data from an open data API and converts it into a pandas DataFrame.
 
@@ -76,9 +78,29 @@ def open_api_to_df(url, database, date, source_date_column=None):
         database (str): The name of the dataset to fetch.
         date (str): The specific date to filter data on (formatted as 'YYYY/MM/DD'). If None, fetches all available data.
         source_date_column (str, optional): The column name in the dataset used to filter by date. Required if a date is provided.
+        schema (dict, optional): Mapping of column names to dtypes for the `fields` payload. Inferred when None.
 
     Returns:
-        DataFrame: A pandas DataFrame containing the data fetched from the API.
+        DataFrame: A pandas DataFrame with one column per key of the records' `fields` payload.
+    """
+    columns = init_columns(schema)
+    fetch_columns(url, database, date, columns, source_date_column)
+    return columns_to_df(columns, schema)
+
+
+def fetch_columns(url, database, date, columns, source_date_column=None):
+    """
+    Fetches a page of records from the open data API and appends its `fields` payload to the column arrays.
+
+    Args:
+        url (str): The base URL for the open data API.
+        database (str): The name of the dataset to fetch.
+        date (str): The specific date to filter data on (formatted as 'YYYY/MM/DD'). If None, fetches all available data.
+        columns (dict): Column name to list of values, as returned by init_columns. Updated in place.
+        source_date_column (str, optional): The column name in the dataset used to filter by date. Required if a date is provided.
+
+    Returns:
+        int: The number of records decoded from the page.
 
     Notes:
         Constructs API parameters based on whether a date filter is provided, and handles pagination by setting a large row count.
@@ -104,11 +126,76 @@ def open_api_to_df(url, database, date, source_date_column=None):
     print(url, params)
     response = requests.get(url, params=params)
     response.raise_for_status()
-    data = response.json()
-    records = data['records']
-    df = pd.DataFrame(records)
-    
-    return df
+    return decode_records(response.content, columns)
+
+
+def init_columns(schema=None):
+    """
+    Creates the empty column arrays that API pages are decoded into.
+
+    Args:
+        schema (dict, optional): Mapping of column names to dtypes. Columns are created up front in schema order.
+
+    Returns:
+        dict: Column name to an empty list of values.
+    """
+    return {column: [] for column in (schema or {})}
+
+
+def decode_records(content, columns):
+    """
+    Decodes an API response body into per-column arrays of the records' `fields` payload.
+
+    Args:
+        content (bytes): The JSON response body.
+        columns (dict): Column name to list of values, as returned by init_columns. Updated in place.
+
+    Returns:
+        int: The number of records decoded.
+
+    Notes:
+        The whole body is held in memory and parsed with the stdlib decoder. Each record is copied into the
+        column arrays by the object hook and then dropped, so the page is not kept as a list of record dicts
+        and no intermediate DataFrame is built.
+        Keys not seen on earlier records are added as new columns, back-filled with None, and keys missing
+        from a record are filled with None.
+    """
+    row_count = len(next(iter(columns.values()), []))
+    start_count = row_count
+
+    def append_record(obj):
+        nonlocal row_count
+        if 'recordid' not in obj or 'fields' not in obj:
+            return obj
+        fields = obj['fields']
+        for key in fields:
+            if key not in columns:
+                columns[key] = [None] * row_count
+        for key, values in columns.items():
+            values.append(fields.get(key))
+        row_count += 1
+        return None
+
+    json.loads(content, object_hook=append_record)
+    return row_count - start_count
+
+
+def columns_to_df(columns, schema=None):
+    """
+    Builds a typed DataFrame from decoded column arrays.
+
+    Args:
+        columns (dict): Column name to list of values, as filled by decode_records.
+        schema (dict, optional): Mapping of column names to dtypes. Columns not listed keep the dtype pandas infers.
+
+    Returns:
+        DataFrame: A pandas DataFrame with one column per decoded field.
+    """
+    schema = schema or {}
+    return pd.DataFrame({
+        column: pd.Series(values, dtype=schema.get(column))
+        for column, values in columns.items()
+    })
 
 
 def subset_date(df, lookback_date_column, lookback_days):
@@ -0,0 +1,204 @@
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import src.utils.utilities as utils
+
+DEFAULT_FILE_FORMAT = 'parquet'
+DEFAULT_ZONES = [utils.DATA_SOURCING_DIRECTORY, utils.DATA_ARCHIVAL_DIRECTORY]
+
+
+def list_dataset_files(namespace, dataset, file_format=DEFAULT_FILE_FORMAT, zones=None):
+    """
+    Lists the staged files of a dataset across the landing zone and the archive.
+
+    Args:
+        namespace (str): The namespace the dataset was sourced under.
+        dataset (str): The dataset name.
+        file_format (str): The file format to pick up ('parquet' or 'csv'). Files of other formats are skipped.
+        zones (list, optional): The directories to read from. Defaults to the sourcing and archive directories.
+
+    Returns:
+        list: File paths ordered by their load timestamp filename, oldest first.
+
+    Prints:
+        str: A warning with the number of files skipped because they were staged in another format.
+    """
+    zones = zones or DEFAULT_ZONES
+    files = []
+    skipped = 0
+    for zone in zones:
+        path = os.path.join(utils.LANDING_DATA_DIRECTORY, namespace, dataset, zone)
+        if not os.path.exists(path):
+            continue
+        for filename in utils.list_objects_in_directory(path):
+            if filename.endswith(f'.{file_format.lower()}'):
+                files.append(os.path.join(path, filename))
+            else:
+                skipped += 1
+    if skipped:
+        print(f'WARNING: skipping {skipped} files of {dataset} not staged as {file_format}, they are not part of the scan')
+    return sorted(files, key=os.path.basename)
+
+
+def read_file_schema(path, file_format):
+    """
+    Reads the schema of a single staged file without decoding its data.
+
+    Args:
+        path (str): The path to the staged file.
+        file_format (str): The file format ('parquet' or 'csv').
+
+    Returns:
+        pyarrow.Schema: The schema stored in the Parquet footer, or inferred from the first block of a CSV file.
+    """
+    if file_format.lower() == 'parquet':
+        return pq.read_schema(path)
+    with pa_csv.open_csv(path) as reader:
+        return reader.schema
+
+
+def unify_schema(files, file_format, columns=None):
+    """
+    Builds one schema covering the requested columns of every file of a dataset.
+
+    Args:
+        files (list): The paths of the staged files.
+        file_format (str): The file format ('parquet' or 'csv').
+        columns (list, optional): The columns to unify. Unifies all columns when None.
+
+    Returns:
+        pyarrow.Schema: The unified schema.
+
+    Notes:
+        Staged files infer their types one load at a time, so a column can be int64 in one file and double in
+        another, or null in a file where it was empty. Types are promoted permissively (null to any type, int
+        to double) instead of taking the schema of the first file. Columns outside the projection are left out,
+        so drift in a column the model never reads does not abort the scan.
+    """
+    schemas = []
+    for path in files:
+        schema = read_file_schema(path, file_format)
+        if columns is not None:
+            schema = pa.schema([schema.field(name) for name in columns if name in schema.names])
+        schemas.append(schema)
+    return pa.unify_schemas(schemas, promote_options='permissive')
+
+
+def read_dataset(namespace, dataset, file_format=DEFAULT_FILE_FORMAT, columns=None, filters=None, zones=None):
+    """
+    Reads the staged files of a dataset into a DataFrame with a single multi-threaded pyarrow scan.
+
+    Args:
+        namespace (str): The namespace the dataset was sourced under.
+        dataset (str): The dataset name.
+        file_format (str): The file format of the staged files ('parquet' or 'csv').
+        columns (list, optional): The columns to read. Reads all columns when None.
+        filters (list, optional): Predicates as [column, op, value] lists, ANDed together, e.g. [['location_id', '=', 1]].
+        zones (list, optional): The directories to read from. Defaults to the sourcing and archive directories.
+
+    Returns:
+        DataFrame: A pandas DataFrame with the matching rows, in load timestamp order.
+
+    Raises:
+        ValueError: If no files of the given format are staged for the dataset.
+
+    Notes:
+        The filters are pushed down into the scan so Parquet row groups whose statistics cannot match are skipped,
+        and only the requested columns are decoded.
+    """
+    zones = zones or DEFAULT_ZONES
+    files = list_dataset_files(namespace, dataset, file_format, zones)
+    if not files:
+        raise ValueError(f'No {file_format} files found for {dataset} in {zones} of {utils.LANDING_DATA_DIRECTORY}')
+
+    print(f'Scanning {len(files)} files for {dataset}')
+    schema_columns = None
+    if columns is not None:
+        schema_columns = list(columns) + [f[0] for f in filters or [] if f[0] not in columns]
+    schema = unify_schema(files, file_format, schema_columns)
+    scan = ds.dataset(files, format=file_format.lower(), schema=schema)
+    expression = pq.filters_to_expression([tuple(f) for f in filters]) if filters else None
+    table = scan.to_table(columns=columns, filter=expression, use_threads=True)
+    return table.to_pandas(use_threads=True)
+
+
+def run_pipeline(namespace, attributes):
+    """
+    Runs a columnar model: filter, join, derive, group-by aggregate and top-N over staged files.
+
+    Args:
+        namespace (str): The namespace the datasets were sourced under.
+        attributes (dict): The model configuration. Supported keys, applied in this order:
+            source (dict): dataset, plus optional file_format, columns and filters passed to read_dataset.
+            join (dict, optional): dataset, join_on, plus optional how (default 'left'), file_format, columns, filters
+                and dedupe_on, which keeps only the latest loaded row per key as the upsert ingestion does.
+            derive (dict, optional): new column name to a pandas eval expression, e.g. direction_1 + direction_2.
+            date_parts (dict, optional): date column to a mapping of new column name to strftime format.
+            group_by (list, optional) and aggregate (dict): group-by keys and column to aggregation function.
+            top_n (dict, optional): order_by (column to 'asc'/'desc', later columns break ties) and n, plus optional
+                partition_by to keep the top n rows per group.
+            rename (dict, optional), select (list, optional) and order_by (dict, optional, column to 'asc'/'desc').
+
+    Returns:
+        DataFrame: The model output.
+    """
+    source = attributes['source']
+    df = read_dataset(namespace, source['dataset'], source.get('file_format', DEFAULT_FILE_FORMAT),
+                      source.get('columns'), source.get('filters'))
+    print(f'Read {len(df)} rows from {source["dataset"]}')
+
+    join = attributes.get('join')
+    if join:
+        right = read_dataset(namespace, join['dataset'], join.get('file_format', DEFAULT_FILE_FORMAT),
+                             join.get('columns'), join.get('filters'))
+        if join.get('dedupe_on'):
+            right = right.drop_duplicates(subset=join['dedupe_on'], keep='last')
+        print(f'Joining {len(right)} rows from {join["dataset"]} on {join["join_on"]}')
+        df = df.merge(right, on=join['join_on'], how=join.get('how', 'left'))
+
+    for column, expression in attributes.get('derive', {}).items():
+        df[column] = df.eval(expression)
+
+    for date_column, parts in attributes.get('date_parts', {}).items():
+        dates = pd.to_datetime(df[date_column])
+        for column, date_format in parts.items():
+            df[column] = dates.dt.strftime(date_format)
+
+    if attributes.get('group_by'):
+        print(f'Aggregating by {attributes["group_by"]}')
+        df = df.groupby(attributes['group_by'], as_index=False, dropna=False, sort=False).agg(attributes['aggregate'])
+
+    top_n = attributes.get('top_n')
+    if top_n:
+        df = sort_by(df, top_n['order_by'])
+        if top_n.get('partition_by'):
+            df = df.groupby(top_n['partition_by'], dropna=False, sort=False).head(top_n['n'])
+        else:
+            df = df.head(top_n['n'])
+
+    if attributes.get('rename'):
+        df = df.rename(columns=attributes['rename'])
+    if attributes.get('select'):
+        df = df[attributes['select']]
+    if attributes.get('order_by'):
+        df = sort_by(df, attributes['order_by'])
+
+    return df.reset_index(drop=True)
+
+
+def sort_by(df, order_by):
+    """
+    Sorts a DataFrame by an ordered mapping of columns to directions.
+
+    Args:
+        df (DataFrame): The pandas DataFrame to sort.
+        order_by (dict): Column to 'asc' or 'desc', in priority order.
+
+    Returns:
+        DataFrame: The sorted DataFrame. Rows that tie on every column keep their current order.
+    """
+    return df.sort_values(list(order_by), ascending=[direction.lower() == 'asc' for direction in order_by.values()],
+                          kind='stable')